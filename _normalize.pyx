@@ -0,0 +1,44 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+_normalize.pyx — optional C build of flashcard.normalize_answer.
+
+Build in place (needs Cython and a C compiler):
+    cythonize -i _normalize.pyx
+
+flashcard.py picks it up automatically when the compiled module is present
+and falls back to the pure-Python version otherwise.
+"""
+
+
+cpdef str normalize(str s):
+    """Casefold `s`, collapse whitespace runs to one space and strip the ends."""
+    if not s.isascii():
+        # casefold() and Unicode whitespace need the full str machinery
+        return " ".join(s.casefold().split())
+
+    cdef bytes src = s.encode("ascii")
+    cdef const unsigned char* p = src
+    cdef Py_ssize_t n = len(src)
+    cdef bytearray out = bytearray(n)
+    cdef unsigned char* q = out
+    cdef Py_ssize_t i, j = 0
+    cdef unsigned char c
+    cdef bint pending = False
+
+    for i in range(n):
+        c = p[i]
+        # ASCII characters for which str.isspace() is true
+        if c == 32 or 9 <= c <= 13 or 28 <= c <= 31:
+            if j:
+                pending = True
+            continue
+        if pending:
+            q[j] = 32
+            j += 1
+            pending = False
+        if 65 <= c <= 90:
+            c += 32
+        q[j] = c
+        j += 1
+
+    return out[:j].decode("ascii")
@@ -10,23 +10,28 @@ Usage:
 
 Dependencies:
   pip install pyyaml
+  (the PyYAML wheels ship with libyaml on most platforms; when present,
+  the faster C loader is used automatically)
 """
 
 from __future__ import annotations
+import io
+import os
 import sys
 import random
+import hashlib
+import pickle
 from pathlib import Path
 from typing import Any, Dict, List
 
-try:
-    import yaml  # PyYAML
-except ImportError as e:
-    sys.stderr.write("ERROR: PyYAML is not installed. Try: pip install pyyaml\n")
-    sys.exit(1)
-
 
 DATA_FILENAME = "bio_practice.yml"
 
+# Parsed question sets are pickled here, one file per YAML path, together with the
+# (mtime, size) they were parsed at; an edited file overwrites its stale entry.
+CACHE_DIR = Path.home() / ".cache" / "flashcards"
+CACHE_VERSION = 1
+
 
 def yn_prompt(prompt: str) -> bool:
     """Ask a yes/no question; loop until a valid answer is given.
@@ -48,14 +53,32 @@ def press_enter(msg: str = "Press Enter to reveal the model answer...") -> None:
         pass
 
 
+_YAML = None
+
+
+def _get_yaml() -> Any:
+    """Import PyYAML on first use; a cached question set doesn't need it."""
+    global _YAML
+    if _YAML is None:
+        try:
+            import yaml  # PyYAML
+        except ImportError:
+            sys.stderr.write("ERROR: PyYAML is not installed. Try: pip install pyyaml\n")
+            sys.exit(1)
+        _YAML = yaml
+    return _YAML
+
+
 def load_questions(path: Path) -> Dict[str, Any]:
     if not path.exists():
         sys.stderr.write(f"ERROR: Could not find data file: {path}\n")
         sys.stderr.write("Make sure bio_practice.yml is in the same folder as this script.\n")
         sys.exit(1)
+    yaml = _get_yaml()
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
         with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=loader)
             if not isinstance(data, dict) or "questions" not in data:
                 raise ValueError("YAML must contain a top-level 'questions' list")
             if not isinstance(data["questions"], list):
@@ -66,6 +89,34 @@ def load_questions(path: Path) -> Dict[str, Any]:
         sys.exit(1)
 
 
+def load_questions_cached(path: Path) -> Dict[str, Any]:
+    """Like load_questions, but skip YAML parsing when the file is unchanged."""
+    try:
+        st = path.stat()
+    except OSError:
+        return load_questions(path)
+
+    key = f"{CACHE_VERSION}|{path.resolve()}"
+    cache_path = CACHE_DIR / (hashlib.sha1(key.encode("utf-8")).hexdigest() + ".pkl")
+    stamp = (st.st_mtime_ns, st.st_size)
+    try:
+        with cache_path.open("rb") as f:
+            cached_stamp, data = pickle.load(f)
+        if cached_stamp == stamp:
+            return data
+    except Exception:
+        pass
+
+    data = load_questions(path)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with cache_path.open("wb") as f:
+            pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return data
+
+
 def ask_question(q: Dict[str, Any]) -> bool:
     qid = q.get("id", "<no-id>")
     prompt = q.get("prompt", "<no-prompt>")
@@ -109,7 +160,7 @@ def main() -> None:
     script_dir = Path(__file__).resolve().parent
     data_path = script_dir / DATA_FILENAME
 
-    data = load_questions(data_path)
+    data = load_questions_cached(data_path)
     questions: List[Dict[str, Any]] = data["questions"]
 
     # Order choice
@@ -132,15 +183,17 @@ def main() -> None:
         else:
             missed.append(q)
 
-    print("\n" + "=" * 72)
-    print("SESSION SUMMARY")
-    print("-" * 72)
-    print(f"Score: {correct_count} / {total}  ({(100.0*correct_count/total):.1f}%)")
+    buf = io.StringIO()
+    print("\n" + "=" * 72, file=buf)
+    print("SESSION SUMMARY", file=buf)
+    print("-" * 72, file=buf)
+    print(f"Score: {correct_count} / {total}  ({(100.0*correct_count/total):.1f}%)", file=buf)
     if missed:
-        print("\nMissed questions:")
+        print("\nMissed questions:", file=buf)
         for q in missed:
-            print(f" - {q.get('id', '<no-id>')}: {q.get('prompt', '<no-prompt>')}")
-    print("=" * 72)
+            print(f" - {q.get('id', '<no-id>')}: {q.get('prompt', '<no-prompt>')}", file=buf)
+    print("=" * 72, file=buf)
+    sys.stdout.write(buf.getvalue())
     print("Done. Good work!")
 
 if __name__ == "__main__":
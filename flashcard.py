@@ -1,20 +1,20 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import io
 import os
+import re
 import sys
+import atexit
+import queue
 import random
+import threading
 import time
 import datetime
-import string
+import hashlib
+import pickle
 from typing import Any, Dict, List, Optional, Tuple
 
-try:
-    import yaml
-except ImportError:
-    print("Missing dependency: pyyaml\nInstall with: pip install pyyaml")
-    sys.exit(1)
-
 # -----------------------
 # Config
 # -----------------------
@@ -22,82 +22,167 @@ except ImportError:
 DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
 SUPPORTED_EXTS = (".yml", ".yaml")
 
+# Parsed decks are pickled here, one file per YAML path; the (mtime, size) the deck
+# was parsed at is stored with it, so an edited deck overwrites its stale entry.
+# Bump CACHE_VERSION whenever the normalized deck layout changes.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "flashcards")
+CACHE_VERSION = 2
+
 # Quiz modes
 MODE_Q_TO_TERM = 1      # use quiz_question -> expect term
 MODE_TERM_TO_DEF = 2    # show term -> reveal full_def
 MODE_MIXED = 3          # random mix
 
+_MODE_NAMES = {
+    MODE_Q_TO_TERM: "Question -> Term",
+    MODE_TERM_TO_DEF: "Term -> Definition",
+    MODE_MIXED: "Mixed",
+}
+
 
 # -----------------------
 # Obfuscated + plain logging
 # -----------------------
 
+# +7 (mod 255) shift applied to every byte of the original line
+_OBFUS_TABLE = bytes((i + 7) % 255 for i in range(256))
+# maps any random byte onto a lowercase filler letter a..z, already shifted by +7
+_FILLER_MAP = bytes((97 + (i % 26) + 7) % 255 for i in range(256))
+
+
 def obfuscate_line(s: str) -> str:
     """
     Obfuscate a line by:
-      1) inserting a random lowercase letter AFTER EVERY ORIGINAL CHARACTER
-         Example: "ABCD" -> "AxByCzDq" (random letters after each original char)
-      2) incrementing each char's codepoint by 7 (mod 255)
-    Returns a readable obfuscated string.
+      1) inserting a random lowercase letter AFTER EVERY ORIGINAL BYTE (UTF-8)
+         Example: "ABCD" -> "AxByCzDq" (random letters after each original byte)
+      2) incrementing each byte by 7 (mod 255)
+    Returns a readable obfuscated string (bytes decoded as latin-1).
     """
-    letters = string.ascii_lowercase
-    expanded = []
-    for ch in s:
-        expanded.append(ch)
-        expanded.append(random.choice(letters))
-    joined = "".join(expanded)
+    b = s.encode("utf-8").translate(_OBFUS_TABLE)
+    out = bytearray(2 * len(b))
+    out[0::2] = b
+    out[1::2] = random.randbytes(len(b)).translate(_FILLER_MAP)
+    return out.decode("latin-1")
 
-    obfus_chars = []
-    for ch in joined:
-        code = ord(ch)
-        obfus_code = (code + 7) % 255
-        obfus_chars.append(chr(obfus_code))
-    return "".join(obfus_chars)
+
+# Log files are opened once (on first answer) and kept open for the session.
+# Writes happen on a background thread so disk I/O never delays the next card.
+_PLAIN_FH = None
+_OBFUS_FH = None
+_LOG_Q: "queue.Queue[Optional[str]]" = queue.Queue()
+_WRITER: Optional[threading.Thread] = None
+# write errors hit by the writer thread, reported from the main thread by log_answer
+_LOG_ERRORS: List[OSError] = []
+
+# [epoch second, formatted timestamp] of the last logged answer
+_TS_CACHE: List[Any] = [0, ""]
+
+
+def _drain_logs() -> None:
+    """Writer thread: append queued plain lines (and their obfuscated form) until None arrives."""
+    while True:
+        line = _LOG_Q.get()
+        if line is None:
+            break
+        # A failed write (disk full, EIO) must not kill the thread: later answers still get queued
+        try:
+            # plain (UTF-8 text)
+            _PLAIN_FH.write(line + "\n")
+            # obfuscated (readable text with per-line obfuscation)
+            _OBFUS_FH.write(obfuscate_line(line) + "\n")
+            # flush once the backlog is written, not after every line
+            if _LOG_Q.empty():
+                _PLAIN_FH.flush()
+                _OBFUS_FH.flush()
+        except OSError as e:
+            _LOG_ERRORS.append(e)
+
+
+def _open_logs() -> None:
+    global _PLAIN_FH, _OBFUS_FH, _WRITER
+    os.makedirs(DATA_DIR, exist_ok=True)
+    _PLAIN_FH = open(os.path.join(DATA_DIR, "answers.log"), "a", encoding="utf-8")
+    _OBFUS_FH = open(os.path.join(DATA_DIR, "stamp.log"), "a", encoding="utf-8")
+    _WRITER = threading.Thread(target=_drain_logs, name="flashcard-log", daemon=True)
+    _WRITER.start()
+    atexit.register(_close_logs)
+
+
+def _close_logs() -> None:
+    """Let the writer thread finish the queue, then close both log files."""
+    global _PLAIN_FH, _OBFUS_FH, _WRITER
+    if _WRITER is not None:
+        _LOG_Q.put(None)
+        _WRITER.join()
+        _WRITER = None
+    for fh in (_PLAIN_FH, _OBFUS_FH):
+        if fh is not None:
+            try:
+                fh.close()
+            except OSError as e:
+                _LOG_ERRORS.append(e)
+    _PLAIN_FH = _OBFUS_FH = None
+    _report_log_errors()
+
+
+def _report_log_errors() -> None:
+    while _LOG_ERRORS:
+        print(f"[!] Could not write answer log: {_LOG_ERRORS.pop(0)}")
 
 
 def log_answer(deck_title: str, mode: str, term: str, user_ans: str, correct: bool) -> None:
     """
-    Append a plain log line to data/answers.log and an obfuscated line to data/stamp.log.
+    Queue a plain log line for data/answers.log and an obfuscated line for data/stamp.log.
     Plain line format (tab-separated):
       YYYY-MM-DD HH:MM:SS    <deck_title>    <mode>    <term>    <user_ans>    <0|1>
     """
-    ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        _TS_CACHE[0] = now
+        _TS_CACHE[1] = datetime.datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S")
+    ts = _TS_CACHE[1]
     line = f"{ts}\t{deck_title}\t{mode}\t{term}\t{user_ans}\t{int(correct)}"
 
-    os.makedirs(DATA_DIR, exist_ok=True)
-    plain_path = os.path.join(DATA_DIR, "answers.log")
-    obfus_path = os.path.join(DATA_DIR, "stamp.log")
-
-    # plain (UTF-8 text)
-    with open(plain_path, "a", encoding="utf-8") as f:
-        f.write(line + "\n")
-
-    # obfuscated (readable text with per-line obfuscation)
-    with open(obfus_path, "a", encoding="utf-8") as f:
-        f.write(obfuscate_line(line) + "\n")
+    if _WRITER is None:
+        _open_logs()
+    _report_log_errors()
+    _LOG_Q.put_nowait(line)
 
 
 # -----------------------
 # Deck loading
 # -----------------------
 
-def discover_deck_files(data_dir: str) -> List[str]:
-    """Return a sorted list of YAML deck file paths from data/."""
+# PyYAML is imported on first use: menus and cached decks don't need it.
+_YAML = None
+
+
+def _get_yaml() -> Any:
+    global _YAML
+    if _YAML is None:
+        try:
+            import yaml
+        except ImportError:
+            print("Missing dependency: pyyaml\nInstall with: pip install pyyaml")
+            sys.exit(1)
+        _YAML = yaml
+    return _YAML
+
+
+def discover_deck_files(data_dir: str) -> List[os.DirEntry]:
+    """Return YAML deck entries from data/, sorted by name (entries cache their stat)."""
     if not os.path.isdir(data_dir):
         return []
-    files = [
-        os.path.join(data_dir, fn)
-        for fn in os.listdir(data_dir)
-        if fn.lower().endswith(SUPPORTED_EXTS)
-    ]
-    files.sort(key=lambda p: os.path.basename(p).lower())
-    return files
+    with os.scandir(data_dir) as it:
+        entries = [e for e in it if e.is_file() and e.name.lower().endswith(SUPPORTED_EXTS)]
+    entries.sort(key=lambda e: e.name.lower())
+    return entries
 
 
 def _normalize_deck_from_data(data: Any, filename: str) -> Dict[str, Any]:
     """
     Normalize a loaded YAML structure into:
-      {"title": str, "cards": [ {term, full_def, quiz_question?}, ... ], "source_file": str}
+      {"title": str, "cards": [Card(term, full_def, quiz_question), ...], "source_file": str}
     Supports both:
       - new style: {title: "...", cards: [...]}
       - old style: [...] (list of cards only)
@@ -119,21 +204,35 @@ def _normalize_deck_from_data(data: Any, filename: str) -> Dict[str, Any]:
     return {"title": base_title, "cards": [], "source_file": filename}
 
 
-def coerce_card(raw: Any) -> Dict[str, str]:
-    """Ensure each card has term/full_def/quiz_question keys (graceful defaults)."""
+class Card:
+    """One flashcard. Slotted: decks hold many of these and the quiz reads them per answer."""
+    __slots__ = ("term", "full_def", "quiz_question")
+
+    def __init__(self, term: str, full_def: str = "", quiz_question: str = "") -> None:
+        self.term = term
+        self.full_def = full_def
+        self.quiz_question = quiz_question
+
+
+def coerce_card(raw: Any) -> Card:
+    """Ensure each card has term/full_def/quiz_question (graceful defaults)."""
     if not isinstance(raw, dict):
-        return {"term": str(raw), "full_def": "", "quiz_question": ""}
+        return Card(str(raw))
     term = str(raw.get("term", "")).strip()
     full_def = str(raw.get("full_def", "")).strip()
     quiz_q = str(raw.get("quiz_question", "")).strip()
-    return {"term": term, "full_def": full_def, "quiz_question": quiz_q}
+    return Card(term, full_def, quiz_q)
 
 
 def load_deck(filepath: str) -> Optional[Dict[str, Any]]:
     """Load one deck file safely."""
+    yaml = _get_yaml()
+    # Prefer the libyaml-backed loader (bundled with the PyYAML wheels on most
+    # platforms); fall back to the pure-Python one when it isn't available.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
         with open(filepath, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=loader)
         return _normalize_deck_from_data(data, filepath)
     except FileNotFoundError:
         print(f"[!] File not found: {filepath}")
@@ -143,12 +242,62 @@ def load_deck(filepath: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _cache_path(filepath: str) -> str:
+    key = f"{CACHE_VERSION}|{os.path.realpath(filepath)}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, digest + ".pkl")
+
+
+def load_deck_cached(filepath: str, st: Optional[os.stat_result] = None) -> Optional[Dict[str, Any]]:
+    """
+    Like load_deck, but reuse a pickled copy of the normalized deck when the
+    YAML file has not changed since it was last parsed.
+    Pass `st` when the caller already has the file's stat (e.g. from scandir).
+    Cache problems are never fatal: we just fall back to parsing the YAML.
+    """
+    if st is None:
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return load_deck(filepath)
+
+    cache_path = _cache_path(filepath)
+    stamp = (st.st_mtime_ns, st.st_size)
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, deck = pickle.load(f)
+        if cached_stamp == stamp:
+            return deck
+    except Exception:
+        pass
+
+    deck = load_deck(filepath)
+    if deck is not None:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump((stamp, deck), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+    return deck
+
+
 # -----------------------
 # UI helpers
 # -----------------------
 
+_CLEAR = "\x1b[2J\x1b[H"   # ANSI: erase screen, cursor home
+
+
 def clear_screen() -> None:
-    os.system("cls" if os.name == "nt" else "clear")
+    if not sys.stdout.isatty():
+        return
+    if os.name == "nt":
+        # legacy Windows consoles may not honor ANSI escapes
+        os.system("cls")
+        return
+    sys.stdout.write(_CLEAR)
+    sys.stdout.flush()
 
 
 def wait_key(prompt="Press Enter to continue...") -> None:
@@ -233,30 +382,37 @@ def choose_count(max_n: int) -> int:
 # Quiz logic
 # -----------------------
 
+_WS_RE = re.compile(r"\s+")
+
+
 def normalize_answer(s: str) -> str:
-    return " ".join(s.lower().split())
+    return _WS_RE.sub(" ", s.casefold()).strip()
+
+
+# Optional compiled normalizer (build with: cythonize -i _normalize.pyx)
+try:
+    from _normalize import normalize as normalize_answer  # noqa: F811
+except ImportError:
+    pass
 
 
 def mode_name(mode: int) -> str:
-    return {
-        MODE_Q_TO_TERM: "Question -> Term",
-        MODE_TERM_TO_DEF: "Term -> Definition",
-        MODE_MIXED: "Mixed",
-    }.get(mode, "Unknown")
+    return _MODE_NAMES.get(mode, "Unknown")
 
 
 def run_quiz(deck: Dict[str, Any], mode: int) -> None:
-    cards = [c for c in deck["cards"] if c.get("term")]
+    cards = [c for c in deck["cards"] if c.term]
     if not cards:
         print("This deck has no cards.")
         return
 
-    random.shuffle(cards)
+    # draw only the n cards we need, already in random order
     n = choose_count(len(cards))
-    cards = cards[:n]
+    cards = random.sample(cards, n)
+    norm_terms = [normalize_answer(c.term) for c in cards]
 
     correct = 0
-    wrong: List[Tuple[Dict[str, str], str]] = []  # (card, user_answer)
+    wrong: List[Tuple[Card, str]] = []  # (card, user_answer)
 
     start = time.time()
     clear_screen()
@@ -268,37 +424,38 @@ def run_quiz(deck: Dict[str, Any], mode: int) -> None:
         this_mode = mode
         if mode == MODE_MIXED:
             this_mode = random.choice([MODE_Q_TO_TERM, MODE_TERM_TO_DEF])
+        this_mode_name = mode_name(this_mode)
 
         print(f"[{idx}/{len(cards)}]")
 
         if this_mode == MODE_Q_TO_TERM:
-            prompt = card.get("quiz_question") or f"Which term fits: {card.get('full_def', '').strip()}"
+            prompt = card.quiz_question or f"Which term fits: {card.full_def}"
             if not prompt:
-                prompt = f"Name the term for: {card.get('term', '')}"
+                prompt = f"Name the term for: {card.term}"
             print(prompt)
             ans = input("> ").strip()
             if ans.lower() == "q":
                 break
-            is_correct = normalize_answer(ans) == normalize_answer(card["term"])
+            is_correct = normalize_answer(ans) == norm_terms[idx - 1]
             if is_correct:
                 print("✓ Correct!")
                 correct += 1
             else:
-                print(f"✗ Incorrect. Answer: {card['term']}")
-                if card.get("full_def"):
-                    print(f"   Def: {card['full_def']}")
+                print(f"✗ Incorrect. Answer: {card.term}")
+                if card.full_def:
+                    print(f"   Def: {card.full_def}")
                 wrong.append((card, ans))
             # log answer (plain + obfuscated)
-            log_answer(deck["title"], mode_name(this_mode), card["term"], ans, is_correct)
+            log_answer(deck["title"], this_mode_name, card.term, ans, is_correct)
             print()
 
         elif this_mode == MODE_TERM_TO_DEF:
-            term = card["term"]
+            term = card.term
             print(f"Term: {term}")
             _ = input("(Press Enter to reveal definition or type 'q' to quit) ")
             if _.strip().lower() == "q":
                 break
-            full_def = card.get("full_def", "").strip()
+            full_def = card.full_def
             if full_def:
                 print(f"Definition: {full_def}")
             else:
@@ -315,7 +472,7 @@ def run_quiz(deck: Dict[str, Any], mode: int) -> None:
                 user_ans = "(unknown)"
 
             # log answer (plain + obfuscated)
-            log_answer(deck["title"], mode_name(this_mode), card["term"], user_ans, is_correct)
+            log_answer(deck["title"], this_mode_name, card.term, user_ans, is_correct)
             print()
 
         else:
@@ -324,23 +481,27 @@ def run_quiz(deck: Dict[str, Any], mode: int) -> None:
 
     elapsed = time.time() - start
     total = len(cards)
-    print("\n--- Results ---")
-    print(f"Score: {correct}/{total}  ({(100.0*correct/total if total else 0):.1f}%)")
-    print(f"Time:  {elapsed:.1f}s")
+    # build the report in memory and emit it with a single write
+    buf = io.StringIO()
+    print("\n--- Results ---", file=buf)
+    print(f"Score: {correct}/{total}  ({(100.0*correct/total if total else 0):.1f}%)", file=buf)
+    print(f"Time:  {elapsed:.1f}s", file=buf)
 
     if wrong:
-        print("\nYou missed these:")
+        print("\nYou missed these:", file=buf)
         for card, user_ans in wrong:
-            term = card["term"]
-            qa = card.get("quiz_question", "")
-            print(f"- Term: {term}")
+            term = card.term
+            qa = card.quiz_question
+            print(f"- Term: {term}", file=buf)
             if qa:
-                print(f"  Q : {qa}")
+                print(f"  Q : {qa}", file=buf)
             if user_ans:
-                print(f"  Your answer: {user_ans}")
-            if card.get("full_def"):
-                print(f"  Def: {card['full_def']}")
-        print()
+                print(f"  Your answer: {user_ans}", file=buf)
+            if card.full_def:
+                print(f"  Def: {card.full_def}", file=buf)
+        print(file=buf)
+
+    sys.stdout.write(buf.getvalue())
 
     wait_key()
 
@@ -350,10 +511,9 @@ def run_quiz(deck: Dict[str, Any], mode: int) -> None:
 # -----------------------
 
 def main() -> None:
-    deck_files = discover_deck_files(DATA_DIR)
     decks: List[Dict[str, Any]] = []
-    for path in deck_files:
-        d = load_deck(path)
+    for entry in discover_deck_files(DATA_DIR):
+        d = load_deck_cached(entry.path, entry.stat())
         if d:
             decks.append(d)
 
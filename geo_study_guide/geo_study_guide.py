@@ -3,7 +3,8 @@ geo_study_guide.py — build a geometry study guide PDF (3 cards per page)
 
 Requires:
   - matplotlib
-  - geo_study_guide_cards.py  (exports: DEFINITIONS [Card...])
+  - pypdf (optional; enables rendering pages in parallel worker processes)
+  - geo_study_guide_cards.py  (exports: DEFINITIONS [Card...], SECTIONS, data in cards.json)
   - geo_study_guide_illustrations.py (exports: resolve_drawer)
 
 Run:
@@ -12,23 +13,24 @@ Output:
     geometry_study_guide.pdf
 """
 
+import io
+import pickle
 import textwrap
-from typing import Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
 
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_pdf import PdfPages
-
-from geo_study_guide_cards import DEFINITIONS   # list of Card dataclass instances (or dicts)
+from geo_study_guide_cards import DEFINITIONS   # sequence of Card named tuples (or dicts)
 from geo_study_guide_illustrations import resolve_drawer
 
 # ---------------- Layout config ----------------
 WRAP_WIDTH = 78
+_WRAPPER = textwrap.TextWrapper(width=WRAP_WIDTH)   # shared by every draw_card call
 PDF_NAME = "geometry_study_guide.pdf"
 
 
 # ---------------- Small helpers ----------------
 def _get(card: Any, key: str, default: Optional[str] = "") -> Any:
-    """Access dataclass attribute or dict field uniformly."""
+    """Access Card attribute or dict field uniformly."""
     if hasattr(card, key):
         return getattr(card, key)
     if isinstance(card, dict):
@@ -36,19 +38,13 @@ def _get(card: Any, key: str, default: Optional[str] = "") -> Any:
     return default
 
 
-def paginate(items, n):
-    for i in range(0, len(items), n):
-        yield items[i:i+n]
-
-
 # ---------------- Drawing ----------------
-def draw_card(ax, term: str, description: str, drawer_key: Optional[str], notes: Optional[str] = None):
+def draw_card(ax, term: str, description: str, drawer_fn: Optional[Callable], notes: Optional[str] = None):
+    """Draw one card; drawer_fn is an already-resolved drawer (see resolve_drawer) or None."""
     ax.set_axis_off()
 
-    drawer_fn = resolve_drawer(drawer_key)
-
     # Combine description and notes if notes are present
-    wrapper = textwrap.TextWrapper(width=WRAP_WIDTH)
+    wrapper = _WRAPPER
     body_lines = wrapper.wrap(description or "")
     if notes:
         body_lines.append("")  # empty line before notes
@@ -73,30 +69,99 @@ def draw_card(ax, term: str, description: str, drawer_key: Optional[str], notes:
         tbox.text(0, 0.85, "\n".join(body_lines), fontsize=11, va="top")
 
 
-def build_pdf(cards, out_path=PDF_NAME):
+def _draw_cover(fig):
+    ax = fig.add_subplot(111)
+    ax.axis("off")
+    ax.text(0.5, 0.70, "Geometry Basics", fontsize=22, ha="center")
+    ax.text(0.5, 0.62, "Study Guide by Yevgen Yampolskiy", fontsize=13, ha="center")
+
+
+def _draw_page(fig, chunk):
+    """Lay out up to 3 (term, description, notes, drawer_fn) tuples on one page."""
+    gs = fig.add_gridspec(3, 1, left=0.06, right=0.94, top=0.95, bottom=0.06, hspace=0.35)
+    for i, (term, desc, notes, drawer_fn) in enumerate(chunk):
+        ax = fig.add_subplot(gs[i, 0])
+        draw_card(ax, term, desc, drawer_fn, notes)
+
+
+def _render_one_page(chunk) -> bytes:
+    """Render one page into a standalone single-page PDF (runs in a worker process).
+    chunk is None for the cover, else (term, description, notes, drawer key) tuples;
+    the keys are resolved here, in the worker."""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    buf = io.BytesIO()
+    with PdfPages(buf) as pdf:
+        fig = Figure(figsize=(8.5, 11))
+        if chunk is None:
+            _draw_cover(fig)
+        else:
+            _draw_page(fig, [(term, desc, notes, resolve_drawer(key)) for term, desc, notes, key in chunk])
+        pdf.savefig(fig)
+    return buf.getvalue()
+
+
+def _picklable(obj) -> bool:
+    try:
+        pickle.dumps(obj)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+def build_pdf(cards, out_path=PDF_NAME, workers: Optional[int] = None):
+    """
+    Render the cover plus 3 cards per page into out_path.
+    Pages are drawn in this process by default. With workers > 1 (and pypdf
+    installed) they are rendered in that many worker processes and merged; the
+    merged file is several times larger, since every page embeds its own fonts.
+    Cards whose drawer can't be pickled (e.g. a lambda) fall back to the serial path.
+    """
+    # Read card fields once, up front: (term, description, notes, drawer key).
+    fields = [(_get(c, "term"), _get(c, "description"), _get(c, "notes"), _get(c, "drawer", None))
+              for c in cards]
+
+    # Heavy imports are deferred until a PDF is actually built. Figures are created
+    # directly (not through pyplot), so no interactive/GUI backend is ever loaded.
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_pdf import PdfPages
+    try:
+        from pypdf import PdfWriter
+    except ImportError:
+        PdfWriter = None
+
+    # Workers get the drawer keys (Drawer / str), not the resolved functions
+    key_chunks = [fields[start:start + 3] for start in range(0, len(fields), 3)]
+    if PdfWriter is not None and workers is not None and workers > 1 and len(key_chunks) > 1 \
+            and _picklable(key_chunks):
+        # None -> cover page
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            pages = list(ex.map(_render_one_page, [None] + key_chunks))
+        writer = PdfWriter()
+        for page in pages:
+            writer.append(io.BytesIO(page))
+        with open(out_path, "wb") as f:
+            writer.write(f)
+        return out_path
+
+    # Serial path: resolve each drawer once here: (term, description, notes, drawer_fn)
+    rendered = [(term, desc, notes, resolve_drawer(key)) for term, desc, notes, key in fields]
+    chunks = [rendered[start:start + 3] for start in range(0, len(rendered), 3)]
+
     with PdfPages(out_path) as pdf:
+        # One figure is cleared and reused for every page
+        fig = Figure(figsize=(8.5, 11))
+
         # Cover
-        fig = plt.figure(figsize=(8.5, 11))
-        ax = fig.add_subplot(111)
-        ax.axis("off")
-        ax.text(0.5, 0.70, "Geometry Basics", fontsize=22, ha="center")
-        ax.text(0.5, 0.62, "Study Guide by Yevgen Yampolskiy", fontsize=13, ha="center")
+        _draw_cover(fig)
         pdf.savefig(fig)
-        plt.close(fig)
-
-        # Pages of cards
-        for chunk in paginate(cards, 3):
-            fig = plt.figure(figsize=(8.5, 11))
-            gs = fig.add_gridspec(3, 1, left=0.06, right=0.94, top=0.95, bottom=0.06, hspace=0.35)
-            for i, card in enumerate(chunk):
-                ax = fig.add_subplot(gs[i, 0])
-                term = _get(card, "term")
-                desc = _get(card, "description")
-                notes = _get(card, "notes")
-                drawer_key = _get(card, "drawer", None)
-                draw_card(ax, term, desc, drawer_key, notes)
+
+        # Pages of cards (3 per page)
+        for chunk in chunks:
+            fig.clf()
+            _draw_page(fig, chunk)
             pdf.savefig(fig)
-            plt.close(fig)
 
     return out_path
 
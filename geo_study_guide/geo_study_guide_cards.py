@@ -1,267 +1,220 @@
 # geo_study_guide_cards.py
+#
+# Pure, fully annotated Python, so it can optionally be AOT-compiled with mypyc
+# (pip install mypy), run from this folder:
+#     mypyc geo_study_guide_cards.py
+# CPython then imports the built extension instead of this file.
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Optional, List
+import functools
+import itertools
+import json
+import sys
+from collections.abc import Sequence
+from enum import IntEnum
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple, Union, overload
 
-@dataclass
-class Card:
+class Drawer(IntEnum):
+    """Illustrations available to cards; the renderer dispatches on the integer value.
+    Names match the keys registered in geo_study_guide_illustrations.py (lowercased)."""
+    LINE = 1
+    FINITE_PLANE = 2
+    COLLINEAR = 3
+    COPLANAR = 4
+    SEGMENT = 5
+    MIDPOINT = 6
+    SEGMENT_BISECTOR = 7
+    RAY = 8
+    ORIGIN_OF_RAY = 9
+    OPPOSITE_RAYS = 10
+    BETWEENNESS = 11
+    ANGLE = 12
+    ANGLE_REGIONS = 13
+    DEGREE_MEASURE = 14
+    DEGREE_MEASURE_IMAGE = 15
+    ACUTE_ANGLE = 16
+    RIGHT_ANGLE = 17
+    OBTUSE_ANGLE = 18
+    STRAIGHT_ANGLE = 19
+    REFLEX_ANGLE = 20
+    FULL_ANGLE = 21
+    COMPLEMENTARY = 22
+    SUPPLEMENTARY = 23
+    VERTICAL_ANGLES = 24
+    PERPENDICULAR_LINES = 25
+    PARALLEL_WITH_TRANSVERSAL = 26
+    INTERSECTION = 27
+    CONCURRENT_LINES = 28
+    EQUIDISTANT = 29
+    LOCUS = 30
+    RIGID_TRANSFORMATION = 31
+    CONGRUENT_ANGLES = 32
+    CONGRUENT_FIGURES = 33
+    MIDPOINT_CONSTRUCTION = 34
+    ANGLE_BISECTOR = 35
+
+
+# plain-text drawer key (as stored in cards.json) -> Drawer
+_DRAWER_BY_NAME = {d.name.lower(): d for d in Drawer}
+
+# Hash-consing pool for description/notes text: equal strings share one object.
+_POOL: Dict[str, str] = {}
+
+
+@overload
+def _hc(s: str) -> str: ...
+
+
+@overload
+def _hc(s: Optional[str]) -> Optional[str]: ...
+
+
+def _hc(s: Optional[str]) -> Optional[str]:
+    return None if s is None else _POOL.setdefault(s, s)
+
+
+class Card(NamedTuple):
     term: str
     description: str
-    drawer: Optional[str] = None   # plain-text reference to an illustration function
-    notes: Optional[str] = None    # optional extra explanation/examples
-
-# The cards below are rendered in order by geo_study_guide.py
-DEFINITIONS: List[Card] = [
-    # ---------------- Reasoning / Logic (top cards) ----------------
-    Card(
-        term="Axiom (postulate)",
-        description="A statement accepted as true without proof; used as a starting point for logical reasoning in geometry.",
-        notes="Example: 'Through any two (distinct) points, there is exactly one line.'"
-    ),
-    Card(
-        term="Theorem",
-        description="A statement that has been proven true using axioms, definitions, and previously established theorems.",
-        notes=(
-            "Example: The sum of the interior angles of any triangle is 180°.\n"
-            "This can be proven using parallel lines and alternate interior angles."
-        )
-    ),
-    Card(
-        term="Conjecture",
-        description="An unproven statement believed to be true based on observations or patterns; requires proof or a counterexample.",
-        notes=(
-            "Consider the expression f(n) = n² + n + 41.\n"
-            "For n = 0, 1, 2, ..., 10, the values of f(n) are:\n"
-            "41, 43, 47, 53, 61, 71, 83, 97, 113, 131, 151 — all prime numbers.\n"
-            "This leads to the conjecture:\nf(n) is a prime number for every natural number n.\n"
-            "This is a conjecture until someone proves or disproves it.\n"
-            "Try to prove or disprove this conjecture — without using AI or Google search!"
-        )
-    ),
-    # ---------------- Foundations ----------------
-    Card(
-        term="Point",
-        description="An undefined term representing an exact location in space; has no length, width, or thickness."
-        # no drawer (simple)
-    ),
-    Card(
-        term="Line",
-        description="An undefined term: a straight path extending infinitely in both directions with no thickness.",
-        drawer="line"
-    ),
-    Card(
-        term="Plane",
-        description="An undefined term: a flat surface extending infinitely in all directions."
-    ),
-    Card(
-        term="Space",
-        description="The three-dimensional setting in which geometric objects exist."
-    ),
-    Card(
-        term="Finite plane",
-        description="A bounded portion of a plane; for example, the interior region enclosed by a polygon or a circle.",
-        drawer="finite_plane"
-    ),
-
-    # ---------------- Incidence relations ----------------
-    Card(
-        term="Collinear points",
-        description="Points that lie on the same line.",
-        drawer="collinear"
-    ),
-    Card(
-        term="Coplanar points (or lines)",
-        description="Points or lines that lie in the same plane.",
-        drawer="coplanar"
-    ),
-
-    # ---------------- Segments / Rays ----------------
-    Card(
-        term="Segment",
-        description="A part of a line bounded by two distinct endpoints.",
-        drawer="segment"
-    ),
-    Card(
-        term="Midpoint",
-        description="The point on a segment that is equidistant from both endpoints.",
-        drawer="midpoint"
-    ),
-    Card(
-        term="Segment bisector",
-        description="A line, ray, or segment that passes through the midpoint of a segment, dividing it into two equal parts.",
-        drawer="segment_bisector"
-    ),
-    Card(
-        term="Ray",
-        description="A part of a line that starts at an endpoint (origin) and extends infinitely in one direction.",
-        drawer="ray"
-    ),
-    Card(
-        term="Origin of a ray",
-        description="The common endpoint from which a ray begins.",
-        drawer="origin_of_ray"
-    ),
-    Card(
-        term="Opposite rays",
-        description="Two rays with the same origin that lie on the same line but extend in opposite directions.",
-        drawer="opposite_rays"
-    ),
-    Card(
-        term="Betweenness of points",
-        description="For distinct collinear points A, B, and C, point B is between A and C iff AB + BC = AC.",
-        drawer="betweenness"
-    ),
-
-    # ---------------- Angle basics ----------------
-    Card(
-        term="Angle",
-        description="A figure formed by two rays (sides) sharing a common endpoint (the vertex).",
-        drawer="angle"
-    ),
-    Card(
-        term="Interior and exterior of an angle",
-        description="The plane regions defined by an angle: the interior lies between the sides; the exterior is outside that region.",
-        drawer="angle_regions"
-    ),
-    Card(
-        term="Degree measure of an angle",
-        description="A measure of rotation based on dividing a full turn into 360 equal parts (degrees).",
-        drawer="degree_measure_image"
-    ),
-
-    # ---------------- Angle types ----------------
-    Card(
-        term="Acute angle",
-        description="An angle whose measure is less than 90°.",
-        drawer="acute_angle"
-    ),
-    Card(
-        term="Right angle",
-        description="An angle whose measure is exactly 90°.",
-        drawer="right_angle"
-    ),
-    Card(
-        term="Obtuse angle",
-        description="An angle whose measure is greater than 90° but less than 180°.",
-        drawer="obtuse_angle"
-    ),
-    Card(
-        term="Straight angle",
-        description="An angle whose measure is exactly 180°.",
-        drawer="straight_angle"
-    ),
-    Card(
-        term="Reflex angle",
-        description="An angle whose measure is greater than 180° and less than 360°.",
-        drawer="reflex_angle"
-    ),
-    Card(
-        term="Full angle (complete angle)",
-        description="An angle equal to a full turn (360°).",
-        drawer="full_angle"
-    ),
-
-    # ---------------- Angle relationships ----------------
-    Card(
-        term="Complementary angles",
-        description="Two angles whose measures add to 90°.",
-        drawer="complementary"
-    ),
-    Card(
-        term="Supplementary angles",
-        description="Two angles whose measures add to 180°.",
-        drawer="supplementary"
-    ),
-    Card(
-        term="Vertical angles",
-        description="A pair of nonadjacent angles formed by two intersecting lines; they are congruent.",
-        drawer="vertical_angles"
-    ),
-
-    # ---------------- Parallel & Perpendicular / Transversals ----------------
-    Card(
-        term="Perpendicular lines",
-        description="Lines that intersect to form right angles.",
-        drawer="perpendicular_lines"
-    ),
-    Card(
-        term="Parallel Lines with Transversal",
-        description="Two parallel lines cut by a third line (a transversal), creating special angle pairs (corresponding, alternate interior, etc.).",
-        drawer="parallel_with_transversal"
-    ),
-
-    # ---------------- Concurrency / Intersection ----------------
-    Card(
-        term="Intersection",
-        description="The set of points common to two or more geometric objects (e.g., lines, segments, or planes).",
-        drawer="intersection"
-    ),
-    Card(
-        term="Concurrent lines",
-        description="Three or more lines that intersect at a single point, known as a point of concurrency.",
-        drawer="concurrent_lines"
-    ),
-
-    # ---------------- Distance / Locus ----------------
-    Card(
-        term="Equidistant",
-        description="At the same distance from two or more objects or points.",
-        drawer="equidistant"
-    ),
-    Card(
-        term="Locus",
-        description="The set of all points that satisfy a given condition or rule.",
-        drawer="locus"
-    ),
-
-    # ---------------- Transformations BEFORE congruence ----------------
-    Card(
-        term="Rigid transformation",
-        description="A transformation (translation, rotation, reflection) that preserves distances and angle measures.",
-        drawer="rigid_transformation"
-    ),
-    Card(
-        term="Congruent angles",
-        description="Angles that have equal measure.",
-        drawer="congruent_angles"
-    ),
-    Card(
-        term="Congruent figures",
-        description="Figures that are the same size and shape; one can be mapped to the other by a rigid transformation.",
-        drawer="congruent_figures"
-    ),
-
-    # ---------------- Construction & final skill ----------------
-    Card(
-        term="Construction",
-        description="A precise drawing made using only allowed tools (typically compass and straightedge).",
-        drawer="midpoint_construction"
-    ),
-    Card(
-        term="Angle bisector",
-        description="A ray or segment that divides an angle into two congruent angles.",
-        drawer="angle_bisector"
-    ),
-
-Card(
-    term="Euclidean axioms (Pogorelov–Hilbert system)",
-    description="A modern, formal set of axioms for Euclidean geometry as presented by A.V. Pogorelov. This system was inspired by Hilbert's work.",
-    notes=(
-        "• Axioms of Incidence:\n"
-        "  1. Through any two distinct points, there exists exactly one line.\n"
-        "  2. Every line contains at least two points.\n"
-        "  3. There exist at least three non-collinear points.\n"
-        "\n"
-        "• Axioms of Order:\n"
-        "  4. If point B lies between A and C, then A, B, C are distinct and collinear, and B lies between C and A.\n"
-        "  5. Of any three collinear points, one and only one lies between the other two.\n"
-        "\n"
-        "• Axioms of Congruence:\n"
-        "  6. Every segment is congruent to itself.\n"
-        "  7. If AB ≅ CD and CD ≅ EF, then AB ≅ EF (transitivity).\n"
-        "  8. Congruent segments and angles can be copied from one location to another.\n"
-        "\n"
-        "• Axiom of Parallelism:\n"
-        "  9. Through any point not on a given line, there is exactly one line parallel to the given line.\n"
-    ))
+    drawer: Optional[Drawer] = None   # illustration for the card
+    notes: Optional[str] = None       # optional extra explanation/examples
+
+# The cards live in cards.json, grouped by section (rendered in order by
+# geo_study_guide.py), and are only read the first time something asks for them.
+CARDS_FILE = Path(__file__).with_name("cards.json")
+
+_FIELDS = ("term", "description", "drawer", "notes")
+
+# (terms, descriptions, drawers, notes, section bounds), as returned by _columns()
+_Columns = Tuple[
+    Tuple[str, ...],
+    Tuple[str, ...],
+    Tuple[Optional[Drawer], ...],
+    Tuple[Optional[str], ...],
+    Tuple[Tuple[str, int, int], ...],
 ]
+
+
+@functools.cache
+def _columns() -> _Columns:
+    """Read cards.json once into per-field tuples: (terms, descriptions, drawers, notes),
+    plus a fifth tuple of (section name, start, stop) ranges into them."""
+    with CARDS_FILE.open("rb") as f:
+        sections = json.load(f)
+    bounds: List[Tuple[str, int, int]] = []
+    start = 0
+    for name, section in sections.items():
+        bounds.append((name, start, start + len(section)))
+        start += len(section)
+    records = list(itertools.chain.from_iterable(sections.values()))
+    raw = [tuple(r.get(k) for r in records) for k in _FIELDS]
+    # terms are used as lookup keys; interned strings compare by identity
+    terms = tuple(sys.intern(t) for t in raw[0])
+    descriptions = tuple(_hc(d) for d in raw[1])
+    drawers = tuple(_DRAWER_BY_NAME[d] if d else None for d in raw[2])
+    notes = tuple(_hc(n) for n in raw[3])
+    return terms, descriptions, drawers, notes, tuple(bounds)
+
+
+@functools.cache
+def _term_index() -> Mapping[str, int]:
+    return MappingProxyType({t: i for i, t in enumerate(_columns()[0])})
+
+
+# Struct-of-arrays view of the cards, one tuple per field, for scans that need one field only:
+#   TERMS, DESCRIPTIONS, DRAWER_KEYS (named to avoid confusion with the illustrations
+#   registry), NOTES
+# and TERM_INDEX: term -> position in DEFINITIONS, for O(1) jumps by name:
+#   DEFINITIONS[TERM_INDEX[name]]
+# and SECTIONS: section name -> tuple of its cards, in DEFINITIONS order.
+# All of them are resolved lazily through the module __getattr__ below.
+_COLUMN_NAMES = {"TERMS": 0, "DESCRIPTIONS": 1, "DRAWER_KEYS": 2, "NOTES": 3}
+
+
+def _module_getattr(name: str) -> object:
+    if name in _COLUMN_NAMES:
+        return _columns()[_COLUMN_NAMES[name]]
+    if name == "TERM_INDEX":
+        return _term_index()
+    if name == "SECTIONS":
+        return _sections()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Installed through globals() rather than `def __getattr__`: a compiled mypyc module
+# crashes on import when it defines __getattr__ directly.
+globals()["__getattr__"] = _module_getattr
+
+
+@functools.cache
+def _sections() -> Mapping[str, Tuple[Card, ...]]:
+    return MappingProxyType({name: tuple(DEFINITIONS[start:stop])
+                             for name, start, stop in _columns()[4]})
+
+
+def iter_terms() -> Iterator[str]:
+    return iter(_columns()[0])
+
+
+def iter_drawers() -> Iterator[Optional[Drawer]]:
+    return iter(_columns()[2])
+
+
+def get_card(i: int) -> Card:
+    """Build the i-th card from the per-field tuples."""
+    terms, descriptions, drawers, notes, _ = _columns()
+    return Card(terms[i], descriptions[i], drawers[i], notes[i])
+
+
+class _LazyCards:
+    """Read-only sequence over cards.json that materializes each Card on first access.
+    (Registered with, not derived from, Sequence: mypyc cannot compile that base.)"""
+
+    def __init__(self) -> None:
+        self._cache: Optional[List[Optional[Card]]] = None
+
+    def __len__(self) -> int:
+        return len(_columns()[0])
+
+    @overload
+    def __getitem__(self, i: int) -> Card: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> List[Card]: ...
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[Card, List[Card]]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if self._cache is None:
+            self._cache = [None] * len(self)
+        card = self._cache[i]
+        if card is None:
+            card = self._cache[i] = get_card(i)
+        return card
+
+    def __iter__(self) -> Iterator[Card]:
+        for i in range(len(self)):
+            yield self[i]
+
+    # the rest of the Sequence mixin methods, spelled out since there is no base class
+    def __reversed__(self) -> Iterator[Card]:
+        for i in reversed(range(len(self))):
+            yield self[i]
+
+    def __contains__(self, card: object) -> bool:
+        return any(c == card for c in self)
+
+    def index(self, card: object) -> int:
+        for i, c in enumerate(self):
+            if c == card:
+                return i
+        raise ValueError(f"{card!r} is not in DEFINITIONS")
+
+    def count(self, card: object) -> int:
+        return sum(1 for c in self if c == card)
+
+
+Sequence.register(_LazyCards)
+# Annotated as Sequence (not _LazyCards, not via cast()): the mypyc build crashes on import otherwise
+DEFINITIONS: Sequence[Card] = _LazyCards()  # type: ignore[assignment]
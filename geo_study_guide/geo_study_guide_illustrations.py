@@ -1,33 +1,113 @@
 # geo_study_guide_illustrations.py
 from __future__ import annotations
+import io
 import math
-from typing import Callable, Optional, Union, Dict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Callable, Iterable, List, Optional, Tuple, Union, Dict
 
-import matplotlib.pyplot as plt
-from matplotlib.patches import Arc, Polygon, Rectangle
+import numpy as np
+from cycler import cycler
+from matplotlib.collections import LineCollection
+from matplotlib.patches import FancyArrowPatch, Polygon
+
+from geo_study_guide_cards import Drawer
+
+# Built once and shared by every monochrome drawer (set_prop_cycle accepts a ready Cycler)
+_MONO_CYCLE = cycler(color=["black"])
 
 # -----------------------------------------------------------------------------
 # Registry
 # -----------------------------------------------------------------------------
 DRAWERS: Dict[str, Callable] = {}
+# Drawer value -> function (index 0 unused); filled in at the bottom of this module
+DRAWER_TABLE: Tuple[Optional[Callable], ...] = ()
 
 def register(name: str):
     """Decorator to register a drawer function by plain-text key."""
     def _wrap(fn: Callable):
         DRAWERS[name] = fn
+        _resolve_str.cache_clear()   # a key looked up before it was registered
         return fn
     return _wrap
 
-def resolve_drawer(drawer: Optional[Union[str, Callable]]) -> Optional[Callable]:
-    """Return a callable drawer given a string key or function; else None."""
+@lru_cache(maxsize=256)
+def _resolve_str(key: str) -> Optional[Callable]:
+    return DRAWERS.get(key)
+
+def resolve_drawer(drawer: Optional[Union[Drawer, str, Callable]]) -> Optional[Callable]:
+    """Return a callable drawer given a Drawer, a string key or a function; else None."""
     if drawer is None:
         return None
     if callable(drawer):
         return drawer
+    if isinstance(drawer, Drawer):   # not plain int: True would dispatch to Drawer(1)
+        return DRAWER_TABLE[drawer]
     if isinstance(drawer, str):
-        return DRAWERS.get(drawer)
+        return _resolve_str(drawer)
     return None
 
+# -----------------------------------------------------------------------------
+# Standalone rendering (previews, single-drawer output)
+# -----------------------------------------------------------------------------
+@lru_cache(maxsize=1)
+def _shared_ax():
+    """One Figure + Axes, built on first use and reused by every render() call."""
+    from matplotlib.figure import Figure   # no pyplot: never touches a GUI backend
+    return Figure(figsize=(4, 3)).add_subplot()
+
+def render(key: Union[Drawer, str, Callable], ax=None):
+    """
+    Draw one illustration into `ax` (default: the shared Axes) and return its Figure.
+    The Axes is cleared first; drawers must only touch their own Axes (and inset
+    Axes they create on it), never figure-level state, since the Figure is reused.
+    """
+    drawer_fn = resolve_drawer(key)
+    if drawer_fn is None:
+        raise KeyError(f"no drawer registered for {key!r}")
+    ax = ax or _shared_ax()
+    ax.cla()
+    # cla() keeps the aspect (and the box it shrank the Axes to) set by the last drawer
+    ax.set_aspect("auto")
+    ax.set_position(ax.get_position(original=True))
+    drawer_fn(ax)
+    return ax.figure
+
+def _render_png(key: Union[Drawer, str], figsize: Tuple[float, float], dpi: int) -> bytes:
+    """Draw one illustration on a fresh Figure and return it as PNG bytes (runs in a worker process)."""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    render(key, fig.add_subplot())
+    buf = io.BytesIO()
+    canvas.print_png(buf)
+    return buf.getvalue()
+
+@lru_cache(maxsize=128)
+def render_to_png(name: Union[Drawer, str], dpi: int = 100, w: float = 3, h: float = 3) -> bytes:
+    """PNG bytes of one drawer at w x h inches; drawers are deterministic, so each
+    (name, dpi, w, h) is drawn once per process and the bytes are reused after that."""
+    return _render_png(name, (w, h), dpi)
+
+def render_deck(keys: Iterable[Union[Drawer, str]], workers: Optional[int] = None,
+                figsize: Tuple[float, float] = (4, 3), dpi: int = 100) -> List[bytes]:
+    """
+    Render each drawer key to PNG bytes, in order; repeated keys are drawn once.
+    Figures are independent, so they are drawn in parallel worker processes (each
+    with its own Matplotlib state); workers=1 draws everything in this process
+    instead, through the render_to_png cache.
+    """
+    keys = list(keys)
+    unique = list(dict.fromkeys(keys))
+    if workers == 1 or len(unique) < 2:
+        return [render_to_png(k, dpi, *figsize) for k in keys]
+    n = len(unique)
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        pngs = dict(zip(unique, ex.map(_render_png, unique, [figsize] * n, [dpi] * n)))
+    return [pngs[k] for k in keys]
+
 # -----------------------------------------------------------------------------
 # Shared primitives
 # -----------------------------------------------------------------------------
@@ -35,20 +115,32 @@ def _setup_axes(ax, margin=0.18):
     ax.set_aspect("equal", adjustable="box")
     ax.set_xlim(-1 - margin, 1 + margin)
     ax.set_ylim(-1 - margin, 1 + margin)
-    ax.axis("off")
+    ax.set_axis_off()
+
+@lru_cache(maxsize=64)
+def _dir_vec(angle_deg: float) -> Tuple[float, float]:
+    """Unit vector (cos, sin) for an angle in degrees; drawers reuse a handful of angles."""
+    a = math.radians(angle_deg)
+    return math.cos(a), math.sin(a)
 
 def _draw_point(ax, xy=(0, 0)):
     ax.plot([xy[0]], [xy[1]], marker="o")
 
+def _scatter_points(ax, pts, ms=3):
+    """Black dots at pts [(x, y), ...] as one PathCollection; ms is the marker diameter (points)
+    and the style matches ax.plot(..., marker="o", markersize=ms, color="black")."""
+    pts = np.asarray(pts, dtype=float)
+    ax.scatter(pts[:, 0], pts[:, 1], s=ms**2, marker="o", c="black",
+               linewidths=1.0, edgecolors="black", zorder=2)
+
 def _draw_ray(ax, angle_deg, length=1.1, origin=(0, 0)):
-    a = math.radians(angle_deg)
-    x = origin[0] + length * math.cos(a)
-    y = origin[1] + length * math.sin(a)
+    dx, dy = _dir_vec(angle_deg)
+    x = origin[0] + length * dx
+    y = origin[1] + length * dy
     ax.plot([origin[0], x], [origin[1], y])
 
 def _draw_line(ax, angle_deg, length=1.6):
-    a = math.radians(angle_deg)
-    dx, dy = math.cos(a), math.sin(a)
+    dx, dy = _dir_vec(angle_deg)
     s = length
     ax.plot([-s*dx, s*dx], [-s*dy, s*dy])
 
@@ -57,39 +149,111 @@ def _draw_segment(ax, p, q, mark_ends=True):
     if mark_ends:
         _draw_point(ax, p); _draw_point(ax, q)
 
-def _draw_arc(ax, start_deg, end_deg, radius=0.48, origin=(0, 0)):
+@lru_cache(maxsize=128)
+def _arc_t(s: float, e: float) -> np.ndarray:
+    """Angles (radians) sampling the arc from s to e degrees, one vertex per <= 3°; shared, read-only."""
+    t = np.radians(np.linspace(s, e, max(2, math.ceil((e - s) / 3)) + 1))
+    t.flags.writeable = False
+    return t
+
+def _draw_arc(ax, start_deg, end_deg, radius=0.48, origin=(0, 0), lw=1):
     s = start_deg % 360; e = end_deg % 360
     if e <= s: e += 360
-    ax.add_patch(Arc(origin, 2*radius, 2*radius, angle=0, theta1=s, theta2=e))
+    # a plain polyline is lighter than an Arc patch; butt caps and zorder=1 keep the patch look
+    t = _arc_t(round(s, 6), round(e, 6))
+    ax.plot(origin[0] + radius * np.cos(t), origin[1] + radius * np.sin(t),
+            lw=lw, color="black", solid_capstyle="butt", zorder=1)
+
+def _add_segments(ax, segs, lw=1):
+    """Draw k black segments, given as a (k, 2, 2) array [[(x0, y0), (x1, y1)], ...], as one artist."""
+    ax.add_collection(LineCollection(segs, linewidths=lw, colors="black", capstyle="projecting"))
+
+def _draw_outline(ax, pts, lw=1):
+    """Closed black outline through pts, as one Line2D (patch-like miter joins, zorder 1)."""
+    xs, ys = zip(*pts, pts[0])
+    ax.plot(xs, ys, lw=lw, color="black", solid_joinstyle="miter", solid_capstyle="butt", zorder=1)
+
+# Unit square corner -> along the first side -> opposite corner -> along the second side -> corner
+_UNIT_SQ_X = np.array([0.0, 1.0, 1.0, 0.0, 0.0])
+_UNIT_SQ_Y = np.array([0.0, 0.0, 1.0, 1.0, 0.0])
+_UNIT_SQ_X.flags.writeable = _UNIT_SQ_Y.flags.writeable = False
 
 def _right_angle_marker(ax, corner=(0,0), size=0.18, angle_deg=0):
-    a = math.radians(angle_deg)
-    ux, uy = math.cos(a), math.sin(a)
+    if angle_deg == 0:   # every current caller: axis-aligned, no rotation needed
+        ax.plot(corner[0] + size*_UNIT_SQ_X, corner[1] + size*_UNIT_SQ_Y)
+        return
+    ux, uy = _dir_vec(angle_deg)
     vx, vy = -uy, ux
-    p1 = (corner[0] + size*ux, corner[1] + size*uy)
-    p2 = (p1[0] + size*vx, p1[1] + size*vy)
-    p3 = (corner[0] + size*vx, corner[1] + size*vy)
-    ax.plot([corner[0], p1[0], p2[0], p3[0], corner[0]],
-            [corner[1], p1[1], p2[1], p3[1], corner[1]])
+    ax.plot(corner[0] + size*(ux*_UNIT_SQ_X + vx*_UNIT_SQ_Y),
+            corner[1] + size*(uy*_UNIT_SQ_X + vy*_UNIT_SQ_Y))
+
+@lru_cache(maxsize=32)
+def _circle_xy(n: int = 181, r: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+    """n points around a circle of radius r about the origin (first == last); shared, read-only."""
+    t = np.linspace(0.0, 2 * np.pi, n)
+    xs, ys = r * np.cos(t), r * np.sin(t)
+    xs.flags.writeable = ys.flags.writeable = False
+    return xs, ys
+
+# 128-segment unit circle, shared by every full-circle drawing (scaled/shifted per call)
+_UNIT_CIRCLE = np.vstack(_circle_xy(129))
+_UNIT_CIRCLE.flags.writeable = False
+
+def _draw_circle(ax, radius=0.48, origin=(0, 0), lw=1):
+    """Full circle in the same style as _draw_arc."""
+    ax.plot(origin[0] + radius * _UNIT_CIRCLE[0], origin[1] + radius * _UNIT_CIRCLE[1],
+            lw=lw, color="black", solid_capstyle="butt", zorder=1)
+
+def _rot_poly(cx: float, cy: float, pts: np.ndarray, angle_deg: float) -> np.ndarray:
+    """(N, 2) vertices `pts` rotated by angle_deg about the origin, then moved to (cx, cy)."""
+    ca, sa = _dir_vec(angle_deg)
+    return pts @ np.array([[ca, sa], [-sa, ca]]) + (cx, cy)
+
+def _rotated_rect_points(cx, cy, w, h, angle_deg):
+    pts = np.array([(-w/2, -h/2), (w/2, -h/2), (w/2,  h/2), (-w/2,  h/2)])
+    return _rot_poly(cx, cy, pts, angle_deg)
+
+def _rotated_triangle_points(cx, cy, w, h, angle_deg):
+    pts = np.array([(-w/2, -h/2), (w/2, -h/2), (0.0, h/2)])
+    return _rot_poly(cx, cy, pts, angle_deg)
+
+def _get_panels(ax, left_bounds, right_bounds):
+    """
+    Two side-by-side inset panels on ax. They are built once per (ax, layout) and
+    stored on ax itself, so redrawing into the same Axes (e.g. render()) clears and
+    re-attaches them instead of constructing new insets.
+    """
+    cache = ax.__dict__.setdefault("_geo_panels", {})
+    key = (tuple(left_bounds), tuple(right_bounds))
+    panels = cache.get(key)
+    if panels is None:
+        panels = cache[key] = (ax.inset_axes(left_bounds), ax.inset_axes(right_bounds))
+    else:
+        for panel in panels:
+            panel.cla()
+            if panel not in ax.child_axes:   # ax.cla() detaches child Axes
+                ax.add_child_axes(panel)
+    return panels
 
 def _placeholder(ax, label: str):
     _setup_axes(ax)
     ax.text(0.5, 0.5, f"[{label}]", ha="center", va="center")
 
+def _add_arrow(ax, tail, tip, lw=1, head_scale=12):
+    """Arrow from tail to tip with a filled head; a bare patch, no Annotation/Text around it
+    (zorder 3, as annotations have, so it still draws over points)."""
+    ax.add_patch(FancyArrowPatch(tail, tip, arrowstyle="-|>", lw=lw,
+                                 mutation_scale=head_scale, color="black", zorder=3))
+
 def _draw_arrow_ray(ax, angle_deg, length=1.1, origin=(0, 0), head_scale=12):
     """
     Draw a ray with an arrowhead indicating direction.
     Monochrome; linewidth=1.
     """
-    import math
-    a = math.radians(angle_deg)
-    ex = origin[0] + length * math.cos(a)
-    ey = origin[1] + length * math.sin(a)
-    ax.annotate(
-        "",
-        xy=(ex, ey), xytext=origin,
-        arrowprops=dict(arrowstyle="-|>", lw=1, mutation_scale=head_scale, color="black")
-    )
+    dx, dy = _dir_vec(angle_deg)
+    ex = origin[0] + length * dx
+    ey = origin[1] + length * dy
+    _add_arrow(ax, origin, (ex, ey), lw=1, head_scale=head_scale)
 
 # Helper: draw a line with two arrowheads (both directions)
 # Helper: draw a line with outward arrowheads that don't overlap the line body
@@ -99,9 +263,7 @@ def _draw_double_arrow_line(ax, angle_deg, span=1.05, origin=(0, 0), gap=0.14, l
     span: half-length of the full line (tip-to-tip)
     gap: clearance between each arrowhead and the line body
     """
-    import math
-    a = math.radians(angle_deg)
-    dx, dy = math.cos(a), math.sin(a)
+    dx, dy = _dir_vec(angle_deg)
 
     # Tips (where arrowheads point)
     p1_tip = (origin[0] - span * dx, origin[1] - span * dy)
@@ -115,10 +277,8 @@ def _draw_double_arrow_line(ax, angle_deg, span=1.05, origin=(0, 0), gap=0.14, l
     ax.plot([p1_line[0], p2_line[0]], [p1_line[1], p2_line[1]], lw=lw, color="black")
 
     # Arrowheads (outward)
-    ax.annotate("", xy=p2_tip, xytext=p2_line,
-                arrowprops=dict(arrowstyle="-|>", lw=lw, mutation_scale= head_scale, color="black"))
-    ax.annotate("", xy=p1_tip, xytext=p1_line,
-                arrowprops=dict(arrowstyle="-|>", lw=lw, mutation_scale= head_scale, color="black"))
+    _add_arrow(ax, p2_line, p2_tip, lw=lw, head_scale=head_scale)
+    _add_arrow(ax, p1_line, p1_tip, lw=lw, head_scale=head_scale)
 
 
 # -----------------------------------------------------------------------------
@@ -127,26 +287,26 @@ def _draw_double_arrow_line(ax, angle_deg, span=1.05, origin=(0, 0), gap=0.14, l
 @register("line")
 def drawer_line(ax):
     _setup_axes(ax)
-    ax.set_prop_cycle(color=["black"])  # monochrome
+    ax.set_prop_cycle(_MONO_CYCLE)  # monochrome
     # 10° tilt; use 0 for horizontal if you prefer
     _draw_double_arrow_line(ax, angle_deg=10, span=1.05, gap=0.14, lw=1, head_scale=12)
 
 @register("finite_plane")
 def drawer_finite_plane(ax):
     _setup_axes(ax)
-    ax.add_patch(Rectangle((-0.8, -0.5), 1.6, 1.0, fill=False))
+    _draw_outline(ax, [(-0.8, -0.5), (0.8, -0.5), (0.8, 0.5), (-0.8, 0.5)])
     ax.text(0, -0.9, "bounded region", ha="center")
 
 @register("collinear")
 def drawer_collinear(ax):
     _setup_axes(ax, margin=2.4)           # keeps tips visible up to ~±2.40
-    ax.set_prop_cycle(color=["black"])    # monochrome
+    ax.set_prop_cycle(_MONO_CYCLE)    # monochrome
 
     # Points stay exactly where you placed them
     MS = 3; y = 0.0
     xs = [-1.9, 0.0, 1.9]
     labels = ["A", "B", "C"]
-    ax.plot(xs, [y]*len(xs), marker="o", linestyle="", color="black", markersize=MS)
+    _scatter_points(ax, [(x, y) for x in xs], ms=MS)
     for x, lbl in zip(xs, labels):
         ax.text(x, y + 0.30, lbl, ha="center", fontsize=10)
 
@@ -166,8 +326,7 @@ def drawer_collinear(ax):
 def drawer_coplanar(ax):
     _setup_axes(ax)
     # simple skewed plane with a couple of points/segments
-    poly = Polygon([(-0.9, -0.4), (0.7, -0.6), (0.9, 0.4), (-0.7, 0.6)], closed=True, fill=False)
-    ax.add_patch(poly)
+    _draw_outline(ax, [(-0.9, -0.4), (0.7, -0.6), (0.9, 0.4), (-0.7, 0.6)])
     _draw_point(ax, (0.0, 0.1)); _draw_point(ax, (-0.2, -0.1))
     _draw_segment(ax, (-0.3, 0.2), (0.4, -0.15), mark_ends=False)
 
@@ -195,27 +354,19 @@ def drawer_segment_bisector(ax):
     Segment bisector: perpendicular (left) and oblique (right), monochrome.
     Labels A, M, B are lowered; M is nudged right ~half-letter width.
     """
-    import math
-
     # Two side-by-side panels
-    left  = ax.inset_axes([0.05, 0.12, 0.42, 0.76])   # perpendicular
-    right = ax.inset_axes([0.53, 0.12, 0.42, 0.76])   # oblique
+    left, right = _get_panels(ax, [0.05, 0.12, 0.42, 0.76],   # perpendicular
+                                  [0.53, 0.12, 0.42, 0.76])   # oblique
 
     def draw_base(panel):
         _setup_axes(panel)
-        panel.set_prop_cycle(color=["black"])  # monochrome
+        panel.set_prop_cycle(_MONO_CYCLE)  # monochrome
 
         # Base segment A—M—B
         A, M, B = (-0.90, 0.0), (0.0, 0.0), (0.90, 0.0)
-        panel.plot([A[0], B[0]], [A[1], B[1]], lw=1, color="black")
 
         # Endpoints + midpoint (small markers)
-        panel.plot([A[0], M[0], B[0]], [A[1], M[1], B[1]],
-                   marker="o", linestyle="", color="black", markersize=3)
-
-        # Midpoint tick marks (AM = MB)
-        for x in (-0.45, 0.45):
-            panel.plot([x, x], [-0.06, 0.06], lw=1, color="black")
+        _scatter_points(panel, [A, M, B], ms=3)
 
         # Labels: move down ~one letter; shift M slightly right (~half-letter)
         LABEL_DOWN = 0.34
@@ -226,21 +377,25 @@ def drawer_segment_bisector(ax):
 
         return A, M, B
 
-    # Left panel: perpendicular bisector
+    def draw_segments(panel, A, B, ang):
+        # base segment AB, the midpoint tick marks (AM = MB), and the bisector through M
+        dx, dy = _dir_vec(ang)
+        s = 1.2
+        _add_segments(panel, np.array([
+            [A, B],
+            [(-0.45, -0.06), (-0.45, 0.06)],
+            [( 0.45, -0.06), ( 0.45, 0.06)],
+            [(-s*dx, -s*dy), (s*dx, s*dy)],
+        ]))
+
+    # Left panel: perpendicular bisector (vertical line through M)
     A, M, B = draw_base(left)
-    # draw vertical line through M with thin stroke
-    ang = math.radians(90)
-    s = 1.2
-    left.plot([-s*math.cos(ang), s*math.cos(ang)],
-              [-s*math.sin(ang), s*math.sin(ang)], lw=1, color="black")
+    draw_segments(left, A, B, 90)
     # _right_angle_marker(left, (0.0, 0.0), 0.12, 0)
 
     # Right panel: oblique (not perpendicular) bisector through M
     A, M, B = draw_base(right)
-    ang = math.radians(30)  # any non-90° angle
-    s = 1.2
-    right.plot([-s*math.cos(ang), s*math.cos(ang)],
-               [-s*math.sin(ang), s*math.sin(ang)], lw=1, color="black")
+    draw_segments(right, A, B, 30)  # any non-90° angle
 
 
 
@@ -295,19 +450,16 @@ def drawer_angle_regions(ax):
 @register("degree_measure")
 def drawer_degree_measure(ax):
     _setup_axes(ax)
-    # unit circle and arc
-    theta = [math.radians(t) for t in range(0, 361, 10)]
-    ax.plot([math.cos(t) for t in theta], [math.sin(t) for t in theta])
+    # unit circle and arc (10° steps)
+    xs, ys = _circle_xy(37)
+    ax.plot(xs, ys)
     _draw_arc(ax, 0, 90, 0.7)
     ax.text(0.6, 0.05, "90°", ha="center")
 
 
-@register("degree_measure_image")
-def drawer_degree_measure_image(ax, filename: str | None = None):
-    """
-    Renders Protractor.jpg instead of a plotted drawing.
-    Place Protractor.jpg next to your .py files, or pass a custom path via `filename`.
-    """
+@lru_cache(maxsize=4)
+def _protractor_img(filename: str | None = None):
+    """Find and decode the protractor picture once per `filename`; None if there is none."""
     import os
     from matplotlib import image as mpimg
 
@@ -320,12 +472,20 @@ def drawer_degree_measure_image(ax, filename: str | None = None):
         os.path.join(here, "Protractor.jpg"),
         os.path.join(here, "protractor.jpg"),
     ]
-    img = None
     for p in candidates:
         if p and os.path.exists(p):
             img = mpimg.imread(p)
-            break
+            img.flags.writeable = False   # shared between renders
+            return img
+    return None
 
+@register("degree_measure_image")
+def drawer_degree_measure_image(ax, filename: str | None = None):
+    """
+    Renders Protractor.jpg instead of a plotted drawing.
+    Place Protractor.jpg next to your .py files, or pass a custom path via `filename`.
+    """
+    img = _protractor_img(filename)
     if img is None:
         # Silently skip if not found (no placeholder text)
         ax.set_axis_off()
@@ -358,7 +518,7 @@ def drawer_reflex_angle(ax):
 @register("full_angle")
 def drawer_full_angle(ax):
     _setup_axes(ax)
-    _draw_ray(ax, 0); _draw_arc(ax, 0, 360); ax.text(0.0, -0.2, "360°", ha="center")
+    _draw_ray(ax, 0); _draw_circle(ax); ax.text(0.0, -0.2, "360°", ha="center")
 
 # -----------------------------------------------------------------------------
 # Angle relationships / lines
@@ -485,20 +645,17 @@ def drawer_locus(ax):
     """
     _setup_axes(ax)
 
-    import math
     O = (0.0, 0.0)
     r = 0.72
 
-    # Circle = { P : |PO| = r }
-    theta = [math.radians(t) for t in range(0, 361, 2)]
-    xs = [O[0] + r * math.cos(t) for t in theta]
-    ys = [O[1] + r * math.sin(t) for t in theta]
-    ax.plot(xs, ys)
+    # Circle = { P : |PO| = r }  (2° steps)
+    xs, ys = _circle_xy(181, r)
+    ax.plot(O[0] + xs, O[1] + ys)
 
     # Center and a sample point on the circle
     _draw_point(ax, O); ax.text(O[0], O[1]-0.14, "O", ha="center", fontsize=9)
-    ang = math.radians(35)
-    P = (O[0] + r * math.cos(ang), O[1] + r * math.sin(ang))
+    dx, dy = _dir_vec(35)
+    P = (O[0] + r * dx, O[1] + r * dy)
     _draw_point(ax, P); ax.text(P[0]+0.05, P[1]+0.05, "P", fontsize=9)
 
     # Radius segment (dashed) to show |PO| = r
@@ -521,32 +678,19 @@ def drawer_rigid_transformation(ax):
     Right panel: rectangles (original + rotated).
     Larger shapes, extra spacing, and no arrow overlay.
     """
-    import math
-    from matplotlib.patches import Polygon
-
     # Two wide panels side-by-side
-    ax_tri  = ax.inset_axes([0.05, 0.10, 0.44, 0.80])  # left: triangles
-    ax_rect = ax.inset_axes([0.51, 0.10, 0.44, 0.80])  # right: rectangles
+    ax_tri, ax_rect = _get_panels(ax, [0.05, 0.10, 0.44, 0.80],   # left: triangles
+                                      [0.51, 0.10, 0.44, 0.80])   # right: rectangles
 
     def _setup(panel): _setup_axes(panel)
 
-    def rotated_rect_points(cx, cy, w, h, angle_deg):
-        a = math.radians(angle_deg); ca, sa = math.cos(a), math.sin(a)
-        pts = [(-w/2, -h/2), (w/2, -h/2), (w/2,  h/2), (-w/2,  h/2)]
-        return [(cx + ca*x - sa*y, cy + sa*x + ca*y) for (x, y) in pts]
-
-    def rotated_triangle_points(cx, cy, w, h, angle_deg):
-        base = [(-w/2, -h/2), (w/2, -h/2), (0.0, h/2)]
-        a = math.radians(angle_deg); ca, sa = math.cos(a), math.sin(a)
-        return [(cx + ca*x - sa*y, cy + sa*x + ca*y) for (x, y) in base]
-
     # ---- Left: triangles (bigger, spaced; no overlay arrow) ----
     _setup(ax_tri)
     cxL, cxR, cy = -0.58, 0.58, 0.00
     wT, hT = 0.90, 0.75
     phi = 25
-    T_left  = rotated_triangle_points(cxL, cy, wT, hT, 0)
-    T_right = rotated_triangle_points(cxR, cy, wT, hT, phi)
+    T_left  = _rotated_triangle_points(cxL, cy, wT, hT, 0)
+    T_right = _rotated_triangle_points(cxR, cy, wT, hT, phi)
     ax_tri.add_patch(Polygon(T_left,  closed=True, fill=False))
     ax_tri.add_patch(Polygon(T_right, closed=True, fill=False))
 
@@ -555,8 +699,8 @@ def drawer_rigid_transformation(ax):
     cxLr, cxRr, cyr = -0.64, 0.64, 0.00   # ↑ increased separation
     wR, hR = 0.90, 0.56                   # slightly smaller to avoid clipping when rotated
     theta = 30
-    R_left  = rotated_rect_points(cxLr, cyr, wR, hR, 0)
-    R_right = rotated_rect_points(cxRr, cyr, wR, hR, theta)
+    R_left  = _rotated_rect_points(cxLr, cyr, wR, hR, 0)
+    R_right = _rotated_rect_points(cxRr, cyr, wR, hR, theta)
     ax_rect.add_patch(Polygon(R_left,  closed=True, fill=False))
     ax_rect.add_patch(Polygon(R_right, closed=True, fill=False))
 
@@ -581,31 +725,18 @@ def drawer_congruent_figures(ax):
     Left panel: triangles A and B. Right panel: rectangles A and B.
     Larger shapes with extra spacing and no overlay arrow.
     """
-    import math
-    from matplotlib.patches import Polygon
-
-    ax_tri  = ax.inset_axes([0.05, 0.10, 0.44, 0.80])  # left
-    ax_rect = ax.inset_axes([0.51, 0.10, 0.44, 0.80])  # right
+    ax_tri, ax_rect = _get_panels(ax, [0.05, 0.10, 0.44, 0.80],   # left
+                                      [0.51, 0.10, 0.44, 0.80])   # right
 
     def _setup(panel): _setup_axes(panel)
 
-    def rotated_rect_points(cx, cy, w, h, angle_deg):
-        a = math.radians(angle_deg); ca, sa = math.cos(a), math.sin(a)
-        pts = [(-w/2, -h/2), (w/2, -h/2), (w/2,  h/2), (-w/2,  h/2)]
-        return [(cx + ca*x - sa*y, cy + sa*x + ca*y) for (x, y) in pts]
-
-    def rotated_triangle_points(cx, cy, w, h, angle_deg):
-        base = [(-w/2, -h/2), (w/2, -h/2), (0.0, h/2)]
-        a = math.radians(angle_deg); ca, sa = math.cos(a), math.sin(a)
-        return [(cx + ca*x - sa*y, cy + sa*x + ca*y) for (x, y) in base]
-
     # ---- Left: triangles A, B (spaced) ----
     _setup(ax_tri)
     cxL, cxR, cy = -0.58, 0.58, 0.00
     wT, hT = 0.90, 0.75
     angT = 25
-    A2 = rotated_triangle_points(cxL, cy, wT, hT, 0)
-    B2 = rotated_triangle_points(cxR, cy, wT, hT, angT)
+    A2 = _rotated_triangle_points(cxL, cy, wT, hT, 0)
+    B2 = _rotated_triangle_points(cxR, cy, wT, hT, angT)
     ax_tri.add_patch(Polygon(A2, closed=True, fill=False))
     ax_tri.add_patch(Polygon(B2, closed=True, fill=False))
     ax_tri.text(cxL, cy - 0.78, "A", ha="center", fontsize=9)
@@ -616,8 +747,8 @@ def drawer_congruent_figures(ax):
     cxLr, cxRr, cyr = -0.64, 0.64, 0.00   # ↑ increased separation
     wR, hR = 0.90, 0.56
     angR = 30
-    A = rotated_rect_points(cxLr, cyr, wR, hR, 0)
-    B = rotated_rect_points(cxRr, cyr, wR, hR, angR)
+    A = _rotated_rect_points(cxLr, cyr, wR, hR, 0)
+    B = _rotated_rect_points(cxRr, cyr, wR, hR, angR)
     ax_rect.add_patch(Polygon(A, closed=True, fill=False))
     ax_rect.add_patch(Polygon(B, closed=True, fill=False))
     ax_rect.text(cxLr, cyr - 0.72, "A", ha="center", fontsize=9)
@@ -627,6 +758,42 @@ def drawer_congruent_figures(ax):
 # -----------------------------------------------------------------------------
 # Construction / angle bisector
 # -----------------------------------------------------------------------------
+def _compute_midpt_geom(A=(-1.0, 0.0), B=(1.0, 0.0), r_scale=1.12, tick_h=0.10, square=0.12):
+    """
+    Fixed geometry of the midpoint construction, worked out once:
+    (r, y_int, alpha, beta, segs) = compass radius, height of P/Q, arc directions
+    from A and B to P (degrees), and the straight segments as a (k, 2, 2) array.
+    """
+    # --- Midpoint ticks (AM = MB) ---
+    mx = (A[0] + B[0]) / 2.0
+    xL = (A[0] + mx) / 2.0
+    xR = (mx + B[0]) / 2.0
+
+    # --- Compass arcs from A and B (same radius r > |AB|/2) ---
+    half_len = (B[0] - A[0]) / 2.0  # = 1.0 here
+    r = half_len * r_scale
+    y_int = math.sqrt(max(r*r - half_len*half_len, 0.0))  # arc intersection height
+
+    # Directions to P and Q from each center
+    alpha = math.degrees(math.atan2(y_int, 1.0))  # from A -> P
+    beta  = 180.0 - alpha                          # from B -> P
+
+    # --- Straight lines: AB, the ticks, the perpendicular bisector
+    # and the right-angle square at the intersection (no text) ---
+    s = square
+    segs = np.array([
+        [A, B],
+        [(xL, -tick_h/2), (xL, tick_h/2)],
+        [(xR, -tick_h/2), (xR, tick_h/2)],
+        [(0, -1.2), (0, 1.2)],
+        [(0, 0), (s, 0)], [(s, 0), (s, s)], [(s, s), (0, s)],
+    ])
+    segs.flags.writeable = False
+    return r, y_int, alpha, beta, segs
+
+_MIDPT_A, _MIDPT_B = (-1.0, 0.0), (1.0, 0.0)
+_MIDPT_GEOM = _compute_midpt_geom(_MIDPT_A, _MIDPT_B)
+
 @register("midpoint_construction")
 def drawer_midpoint_construction(ax):
     """
@@ -637,11 +804,8 @@ def drawer_midpoint_construction(ax):
     - A,B labels moved down; P moved up+right; Q moved down+right
     - no '90°' text (square only)
     """
-    import math
-    from matplotlib.patches import Arc, Polygon
-
     _setup_axes(ax)
-    ax.set_prop_cycle(color=["black"])  # monochrome
+    ax.set_prop_cycle(_MONO_CYCLE)  # monochrome
 
     # Tunables
     MS = 3              # marker size for points A,B,P,Q
@@ -649,63 +813,33 @@ def drawer_midpoint_construction(ax):
     LABEL_DX = 0.045    # ~3/4 letter width (approx in these axis units)
     LABEL_DY = 0.13     # ~one letter height
 
-    # --- Base segment AB ---
-    A = (-1.0, 0.0)
-    B = ( 1.0, 0.0)
-    ax.plot([A[0], B[0]], [A[1], B[1]], linewidth=1, color="black")
-    ax.plot([A[0], B[0]], [A[1], B[1]], marker="o", linestyle="", color="black", markersize=MS)
+    A, B = _MIDPT_A, _MIDPT_B
+    r, y_int, alpha, beta, segs = _MIDPT_GEOM   # see _compute_midpt_geom
+
+    # --- Points A, B and the arc intersections P, Q (small markers, one collection) ---
+    _scatter_points(ax, [A, B, (0, y_int), (0, -y_int)], ms=MS)
     # Move A/B labels further down
     ax.text(A[0], -0.30, "A", ha="center", fontsize=10)
     ax.text(B[0], -0.30, "B", ha="center", fontsize=10)
 
-    # --- Midpoint ticks (AM = MB) ---
-    mx = (A[0] + B[0]) / 2.0
-    xL = (A[0] + mx) / 2.0
-    xR = (mx + B[0]) / 2.0
-    tick_h = 0.10
-    ax.plot([xL, xL], [-tick_h/2,  tick_h/2], linewidth=1, color="black")
-    ax.plot([xR, xR], [-tick_h/2,  tick_h/2], linewidth=1, color="black")
-
-    # --- Compass arcs from A and B (same radius r > |AB|/2) ---
-    half_len = (B[0] - A[0]) / 2.0  # = 1.0 here
-    r = half_len * 1.12
-    y_int = math.sqrt(max(r*r - half_len*half_len, 0.0))  # arc intersection height
-
-    # Directions to P and Q from each center
-    alpha = math.degrees(math.atan2(y_int, 1.0))  # from A -> P
-    beta  = 180.0 - alpha                          # from B -> P
+    # --- Compass arcs from A and B ---
     span  = ARC_SPAN_DEG
 
     # A-centered arcs (through P and Q)
-    ax.add_patch(Arc(A, 2*r, 2*r, angle=0,
-                     theta1= alpha - span, theta2= alpha + span,
-                     linewidth=1, edgecolor="black"))
-    ax.add_patch(Arc(A, 2*r, 2*r, angle=0,
-                     theta1=-alpha - span, theta2=-alpha + span,
-                     linewidth=1, edgecolor="black"))
+    _draw_arc(ax,  alpha - span,  alpha + span, r, origin=A)
+    _draw_arc(ax, -alpha - span, -alpha + span, r, origin=A)
 
     # B-centered arcs (through P and Q)
-    ax.add_patch(Arc(B, 2*r, 2*r, angle=0,
-                     theta1= beta - span, theta2= beta + span,
-                     linewidth=1, edgecolor="black"))
-    ax.add_patch(Arc(B, 2*r, 2*r, angle=0,
-                     theta1=-beta - span, theta2=-beta + span,
-                     linewidth=1, edgecolor="black"))
-
-    # --- Perpendicular bisector ---
-    ax.plot([0, 0], [-1.2, 1.2], linewidth=1, color="black")
-
-    # Right-angle square at the intersection (no text)
-    s = 0.12
-    ax.add_patch(Polygon([[0, 0], [s, 0], [s, s], [0, s]],
-                         closed=False, fill=False, linewidth=1))
-
-    # Intersection points P and Q (small markers)
-    ax.plot([0, 0], [ y_int, -y_int], marker="o", linestyle="", color="black", markersize=MS)
+    _draw_arc(ax,  beta - span,  beta + span, r, origin=B)
+    _draw_arc(ax, -beta - span, -beta + span, r, origin=B)
+
+    # --- Straight lines (AB, ticks, bisector, right-angle square), as one collection ---
+    _add_segments(ax, segs)
+
     # Label P: move up by ~letter height and right by ~3/4 letter width
     ax.text(LABEL_DX,  y_int + LABEL_DY, "P", ha="left",  va="bottom", fontsize=10)
     # Label Q: move down and right
-    ax.text(LABEL_DX, -y_int - LABEL_DY, "Q", ha="left",  va="top",    fontsize=10)
+    ax.text(LABEL_DX, -y_int - LABEL_DY, "Q", ha="left",  va="top", fontsize=10)
 
 
 
@@ -718,7 +852,7 @@ def drawer_angle_bisector(ax):
       - two arcs at different radii, with small gaps at the rays and bisector
     """
     _setup_axes(ax)
-    ax.set_prop_cycle(color=["black"])  # monochrome
+    ax.set_prop_cycle(_MONO_CYCLE)  # monochrome
 
     # Rays forming the angle (feel free to change 0° and 70°)
     a1, a2 = 0, 70
@@ -740,3 +874,13 @@ def drawer_angle_bisector(ax):
     # Right part: from bis to a2
     _draw_arc(ax, bis + gap_deg, a2 - gap_deg, radius=r2)
 
+
+# -----------------------------------------------------------------------------
+# Integer dispatch table for Drawer values
+# -----------------------------------------------------------------------------
+# Indexed by value, so gaps or reordering in the enum can't shift the dispatch
+_table: List[Optional[Callable]] = [None] * (max(Drawer) + 1)
+for _d in Drawer:
+    _table[_d] = DRAWERS.get(_d.name.lower())
+DRAWER_TABLE = tuple(_table)
+del _table, _d